@@ -1,3 +1,7 @@
-from .mongo import MongoOperator, MongoConfigsType
+from .mongo import MongoOperator, MongoConfigsType, iter_prefetched
 from .elastic import ElasticOperator, ElasticConfigsType
-from .filters import range_to_mongo_filter_and_sort_info, to_mongo_filter
+from .filters import (
+    range_to_mongo_filter_and_sort_info,
+    to_mongo_filter,
+    to_mongo_projection,
+)
@@ -1,6 +1,16 @@
+from functools import lru_cache
+from types import MappingProxyType
 from typing import Literal, Union
 from tclogger import unify_ts_and_str, str_to_ts
 
+DATE_FIELDS = frozenset(["pubdate", "insert_at", "index_at"])
+MONGO_COMPARE_OPS = MappingProxyType(
+    {"gt": "$gt", "lt": "$lt", "gte": "$gte", "lte": "$lte"}
+)
+
+# same date strings recur across calls, and parsing them is the costly part
+cached_str_to_ts = lru_cache(maxsize=1024)(str_to_ts)
+
 
 def range_to_mongo_filter_and_sort_info(
     filter_index: str = None,
@@ -48,7 +58,7 @@ def to_mongo_filter(
     filter_index: str = None,
     filter_op: Literal["gt", "lt", "gte", "lte", "range"] = "gte",
     filter_range: Union[int, str, tuple, list] = None,
-    date_fields: list[str] = ["pubdate", "insert_at", "index_at"],
+    date_fields: frozenset[str] = DATE_FIELDS,
     is_date_index: bool = None,
 ) -> dict:
     filter_dict = {}
@@ -62,9 +72,9 @@ def to_mongo_filter(
                 l_val, r_val = filter_range
                 if is_date_index is True or filter_index.lower() in date_fields:
                     if isinstance(l_val, str):
-                        l_val = str_to_ts(l_val)
+                        l_val = cached_str_to_ts(l_val)
                     if isinstance(r_val, str):
-                        r_val = str_to_ts(r_val)
+                        r_val = cached_str_to_ts(r_val)
                 if l_val is not None and r_val is not None:
                     filter_dict[filter_index] = {
                         "$lte": max([l_val, r_val]),
@@ -78,14 +88,34 @@ def to_mongo_filter(
                     pass
             else:
                 raise ValueError(f"× Invalid filter_range: {filter_range}")
-        elif filter_op in ["gt", "lt", "gte", "lte"]:
+        elif isinstance(filter_op, str) and filter_op in MONGO_COMPARE_OPS:
             if filter_range and isinstance(filter_range, (int, float, str)):
                 if filter_index.lower() in date_fields:
                     if isinstance(filter_range, str):
-                        filter_range = str_to_ts(filter_range)
-                filter_dict[filter_index] = {f"${filter_op}": filter_range}
+                        filter_range = cached_str_to_ts(filter_range)
+                mongo_op = MONGO_COMPARE_OPS[filter_op]
+                filter_dict[filter_index] = {mongo_op: filter_range}
             else:
                 raise ValueError(f"× Invalid filter_range: {filter_range}")
         else:
             raise ValueError(f"× Invalid filter_op: {filter_op}")
     return filter_dict
+
+
+def to_mongo_projection(
+    include_fields: list[str] = None,
+    exclude_fields: list[str] = None,
+) -> dict:
+    if include_fields and exclude_fields:
+        raise ValueError(
+            f"× Cannot set both include_fields and exclude_fields: "
+            f"{include_fields}, {exclude_fields}"
+        )
+    projection = {}
+    if include_fields:
+        projection.update({field: 1 for field in include_fields})
+        if "_id" not in include_fields:
+            projection["_id"] = 0
+    if exclude_fields:
+        projection.update({field: 0 for field in exclude_fields})
+    return projection
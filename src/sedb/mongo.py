@@ -1,15 +1,99 @@
+import os
 import pymongo
+import queue
 import threading
 
+from bson.raw_bson import RawBSONDocument
+from itertools import islice
 from pathlib import Path
+from pymongo.collection import Collection
 from tclogger import TCLogger, logstr, FileLogger
 from tclogger import get_now_str, ts_to_str, str_to_ts, dict_to_str
 from typing import Literal, Union, TypedDict
 
-from .filters import to_mongo_filter
+from .filters import DATE_FIELDS, to_mongo_filter, to_mongo_projection
 
 logger = TCLogger()
 
+MONGO_CLIENTS: dict[tuple[int, str], pymongo.MongoClient] = {}
+MONGO_CLIENTS_LOCK = threading.Lock()
+
+
+def get_shared_client(endpoint: str, force_new: bool = False) -> pymongo.MongoClient:
+    """Operators with same endpoint share one client, and thus one connection pool.
+
+    Clients are keyed by pid too, as MongoClient is not fork-safe.
+    """
+    key = (os.getpid(), endpoint)
+    with MONGO_CLIENTS_LOCK:
+        client = MONGO_CLIENTS.get(key)
+        if client is None or force_new:
+            client = pymongo.MongoClient(endpoint)
+            MONGO_CLIENTS[key] = client
+    return client
+
+
+def close_shared_client(endpoint: str, client: pymongo.MongoClient = None):
+    """Close and evict shared client of endpoint, so next connect creates a new one.
+
+    If `client` is given, only evict the registered one when it is that client.
+    """
+    key = (os.getpid(), endpoint)
+    with MONGO_CLIENTS_LOCK:
+        registered = MONGO_CLIENTS.get(key)
+        if registered is not None and (client is None or registered is client):
+            MONGO_CLIENTS.pop(key)
+    if client is None:
+        client = registered
+    if client is not None:
+        client.close()
+
+
+def iter_prefetched(cursor, batch_size: int = 1000, queue_size: int = 2):
+    """Yield docs from cursor, while next batches are fetched in a background thread.
+
+    This overlaps the network round-trips of `getMore` with the processing of docs,
+    so throughput is about max(process, network) instead of the sum of them.
+    """
+    docs_queue = queue.Queue(maxsize=queue_size)
+    stop_event = threading.Event()
+    end_flag = object()
+
+    def put(item) -> bool:
+        while not stop_event.is_set():
+            try:
+                docs_queue.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def fetch():
+        try:
+            while not stop_event.is_set():
+                docs = list(islice(cursor, batch_size))
+                if not docs or not put(docs):
+                    break
+        except Exception as e:
+            put(e)
+        finally:
+            put(end_flag)
+            cursor.close()
+
+    thread = threading.Thread(target=fetch, daemon=True)
+    thread.start()
+    try:
+        while True:
+            item = docs_queue.get()
+            if item is end_flag:
+                break
+            if isinstance(item, Exception):
+                raise item
+            yield from item
+    finally:
+        stop_event.set()
+        thread.join()
+
 
 class MongoConfigsType(TypedDict):
     host: str
@@ -25,6 +109,7 @@ class MongoOperator:
         connect_msg: str = None,
         lock: threading.Lock = None,
         log_path: Union[str, Path] = None,
+        require_projection: bool = False,
         verbose: bool = True,
         indent: int = 0,
     ):
@@ -36,6 +121,8 @@ class MongoOperator:
         self.connect_at_init = connect_at_init
         self.connect_msg = connect_msg
         self.lock = lock or threading.Lock()
+        self.require_projection = require_projection
+        self.collections: dict[tuple[str, bool], Collection] = {}
         if log_path:
             self.file_logger = FileLogger(log_path)
         else:
@@ -49,14 +136,15 @@ class MongoOperator:
         self.dbname = self.configs["dbname"]
         self.endpoint = f"mongodb://{self.host}:{self.port}"
 
-    def connect(self, connect_msg: str = None):
+    def connect(self, connect_msg: str = None, force_new: bool = False):
         connect_msg = connect_msg or self.connect_msg
         if self.verbose:
             logger.note(f"> Connecting to: {logstr.mesg('['+self.endpoint+']')}")
             logger.file(f"  * {get_now_str()}")
             if connect_msg:
                 logger.file(f"  * {connect_msg}")
-        self.client = pymongo.MongoClient(self.endpoint)
+        self.client = get_shared_client(self.endpoint, force_new=force_new)
+        self.collections = {}
         try:
             self.db = self.client[self.dbname]
             if self.verbose:
@@ -64,7 +152,33 @@ class MongoOperator:
         except Exception as e:
             raise e
 
+    def close(self):
+        """Close the shared client of this endpoint, which other operators may use."""
+        client = getattr(self, "client", None)
+        if client is not None:
+            close_shared_client(self.endpoint, client=client)
+            self.client = None
+
+    def get_collection(self, collection: str, raw_bson: bool = False) -> Collection:
+        key = (collection, raw_bson)
+        db_collect = self.collections.get(key)
+        if db_collect is None:
+            if raw_bson:
+                # docs are returned as undecoded RawBSONDocument
+                codec_options = self.db.codec_options.with_options(
+                    document_class=RawBSONDocument
+                )
+                db_collect = self.db.get_collection(
+                    collection, codec_options=codec_options
+                )
+            else:
+                db_collect = self.db[collection]
+            self.collections[key] = db_collect
+        return db_collect
+
     def log_error(self, docs: list = None, e: Exception = None):
+        if not self.verbose and not self.file_logger:
+            return
         error_info = {"datetime": get_now_str(), "doc": docs, "error": repr(e)}
         if self.verbose:
             logger.err(f"× Mongo Error: {logstr.warn(error_info)}")
@@ -75,18 +189,25 @@ class MongoOperator:
     def log_args(
         self,
         args_dict: dict,
-        date_fields: list[str] = ["pubdate", "insert_at", "index_at"],
+        date_fields: frozenset[str] = DATE_FIELDS,
     ):
+        if not self.verbose:
+            return
         filter_index = args_dict["filter_index"]
         filter_range = args_dict["filter_range"]
         if filter_index and filter_index.lower() in date_fields:
             if isinstance(filter_range, (tuple, list)):
-                filter_range_ts = [
-                    str_to_ts(i) if isinstance(i, str) else i for i in filter_range
-                ]
-                filter_range_str = [
-                    ts_to_str(i) if isinstance(i, int) else i for i in filter_range
-                ]
+                filter_range_ts, filter_range_str = [], []
+                for i in filter_range:
+                    if isinstance(i, str):
+                        filter_range_ts.append(str_to_ts(i))
+                        filter_range_str.append(i)
+                    elif isinstance(i, int):
+                        filter_range_ts.append(i)
+                        filter_range_str.append(ts_to_str(i))
+                    else:
+                        filter_range_ts.append(i)
+                        filter_range_str.append(i)
             elif isinstance(filter_range, int):
                 filter_range_ts = filter_range
                 filter_range_str = ts_to_str(filter_range)
@@ -110,13 +231,27 @@ class MongoOperator:
         sort_index: str = None,
         sort_order: Literal["asc", "desc"] = "asc",
         is_date_index: bool = None,
+        include_fields: list[str] = None,
+        exclude_fields: list[str] = None,
+        hint: Union[str, list[tuple[str, int]]] = None,
+        allow_disk_use: bool = None,
+        batch_size: int = None,
+        raw_bson: bool = False,
+        prefetch: bool = False,
     ):
+        if self.require_projection and not (include_fields or exclude_fields):
+            raise ValueError(
+                "× Projection required: set include_fields or exclude_fields"
+            )
         filter_dict = to_mongo_filter(
             filter_index=filter_index,
             filter_op=filter_op,
             filter_range=filter_range,
             is_date_index=is_date_index,
         )
+        projection = to_mongo_projection(
+            include_fields=include_fields, exclude_fields=exclude_fields
+        )
         if self.verbose:
             args_dict = {
                 "collection": collection,
@@ -125,11 +260,25 @@ class MongoOperator:
                 "filter_range": filter_range,
                 "sort_index": sort_index,
                 "sort_order": sort_order,
+                "hint": hint,
+                "allow_disk_use": allow_disk_use,
+                "batch_size": batch_size,
+                "raw_bson": raw_bson,
                 "filter_dict": filter_dict,
+                "projection": projection,
             }
             self.log_args(args_dict)
 
-        cursor = self.db[collection].find(filter_dict)
+        db_collect = self.get_collection(collection, raw_bson=raw_bson)
+        cursor = db_collect.find(
+            filter_dict, projection or None, allow_disk_use=allow_disk_use
+        )
+
+        if hint:
+            cursor = cursor.hint(hint)
+
+        if batch_size:
+            cursor = cursor.batch_size(batch_size)
 
         if sort_index:
             if sort_order and sort_order.lower().startswith("desc"):
@@ -138,4 +287,7 @@ class MongoOperator:
                 order = pymongo.ASCENDING
             cursor = cursor.sort(sort_index, order)
 
+        if prefetch:
+            return iter_prefetched(cursor, batch_size=batch_size or 1000)
+
         return cursor